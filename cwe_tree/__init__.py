@@ -1,4 +1,5 @@
-import csv, os
+import csv, os, pickle, threading
+from operator import itemgetter
 from .cwe_node import CweNode  # Import the CweNode class (represents a CWE node)
 from .cwe_tree import CweTree  # Import the CweTree class (represents the entire CWE tree)
 
@@ -6,10 +7,47 @@ from .cwe_tree import CweTree  # Import the CweTree class (represents the entire
 base_path = os.path.dirname(os.path.abspath(__file__))  # Get the module's directory path
 nodes_csv = os.path.join(base_path, "data", "nodes.csv")  # Path to the nodes CSV file
 rels_csv = os.path.join(base_path, "data", "rels.csv")  # Path to the relationships CSV file
+tree_pkl = os.path.join(base_path, "data", "tree.pkl")  # Path to the pickled CweTree cache
+pickle_protocol = 4  # Highest protocol every supported Python (>= 3.6) can read
+csv_buffer_size = 1 << 20  # Read buffer for the CSV files; large enough to fetch each file in one read
 
-def _load_data(cwe_tree: CweTree) -> CweTree:
+_query_lock = threading.Lock()  # Serializes the first build of the shared `query` tree
+
+# Files the pickle cache is derived from; the cache is stale if any of them is newer than it
+_cache_sources = (
+    nodes_csv,
+    rels_csv,
+    os.path.join(base_path, "cwe_node.py"),  # Class layouts are baked into the pickle
+    os.path.join(base_path, "cwe_tree.py"),
+    os.path.abspath(__file__),  # The loader itself (e.g. post-load steps such as `_finalize()`)
+)
+
+def _read_csv(path: str, *columns: str):
+    """
+    Streams the given columns of a CSV file as bare tuples.
+
+    Shared by the loader and the build-time data validation in `setup.py`, so both parse the files
+    the same way. Blank lines are skipped.
+
+    Args:
+        path (str): The CSV file to read.
+        *columns (str): Header names of the columns to extract, in output order.
+
+    Returns:
+        Iterator[tuple]: One tuple of column values per row.
+
+    Raises:
+        KeyError: If a column is missing from the header.
+        IndexError: If a row has fewer fields than the header.
+    """
+    with open(path, "r", encoding="utf-8", newline="", buffering=csv_buffer_size) as f:
+        reader = csv.reader(f)  # Stream rows as plain lists (no per-row dict)
+        idx = {name: i for i, name in enumerate(next(reader))}  # Resolve column positions once from the header
+        yield from map(itemgetter(*(idx[name] for name in columns)), filter(None, reader))  # Row -> tuple in C
+
+def _build_tree(cwe_tree: CweTree) -> CweTree:
     """
-    Loads data from `nodes.csv` and `rels.csv` in the `data/` directory and populates the CweTree instance.
+    Parses `nodes.csv` and `rels.csv` in the `data/` directory and populates the CweTree instance.
 
     Args:
         cwe_tree (CweTree): An instance of CweTree to be populated with data.
@@ -17,32 +55,106 @@ def _load_data(cwe_tree: CweTree) -> CweTree:
     Returns:
         CweTree: A fully populated CweTree instance containing all CWE nodes and relationships.
     """
-    base_path = os.path.dirname(os.path.abspath(__file__))  # Get module's directory path
-    nodes_csv = os.path.join(base_path, "data", "nodes.csv")  # Path to the nodes CSV file
-    rels_csv = os.path.join(base_path, "data", "rels.csv")  # Path to the relationships CSV file
-
     # Read `nodes.csv` and add nodes to the CweTree
-    with open(nodes_csv, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)  # Read CSV as a dictionary
-        for row in reader:
-            cwe_id = row["id"]  # Retrieve CWE ID
-            name = row["name"]  # Retrieve CWE name
-            abstract = row["abstract"]  # Retrieve CWE abstraction type
-            layer = row["layer"]  # Retrieve layer information
-            cwe_tree._add_node(cwe_id, name, abstract, layer)  # Add node to CweTree
+    add_node = cwe_tree._add_node  # Bind once instead of per row
+    for cwe_id, name, abstract, layer in _read_csv(nodes_csv, "id", "name", "abstract", "layer"):
+        add_node(cwe_id, name, abstract, layer)  # Add node to CweTree
 
     # Read `rels.csv` and add relationships (edges)
-    with open(rels_csv, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)  # Read CSV as a dictionary
-        for row in reader:
-            parent_id = row["source"]  # Retrieve source (parent) CWE ID
-            child_id = row["target"]  # Retrieve target (child) CWE ID
-            cwe_tree._add_edge(parent_id, child_id)  # Add edge (parent-child relationship) in CweTree
+    add_edge = cwe_tree._add_edge_unchecked  # Bind once; endpoints are validated at build time
+    for parent_id, child_id in _read_csv(rels_csv, "source", "target"):
+        add_edge(parent_id, child_id)  # Add edge (parent-child relationship) in CweTree
 
+    cwe_tree._finalize()  # Build the integer index once all nodes and edges are in place
     return cwe_tree  # Return the populated CweTree instance
 
-# Create a `CweTree` instance and load data immediately when the module is imported
-query: CweTree = _load_data(CweTree())
+def _cache_is_fresh() -> bool:
+    """
+    Checks whether `tree.pkl` exists and is newer than every file it was built from.
+
+    Returns:
+        bool: True if the pickled tree can be loaded instead of re-parsing the CSV files.
+    """
+    try:
+        cache_mtime = os.path.getmtime(tree_pkl)
+    except OSError:
+        return False  # No cache yet
+    return all(os.path.getmtime(path) <= cache_mtime for path in _cache_sources)
+
+def _dump_tree(cwe_tree: CweTree, path: str):
+    """
+    Pickles a populated CweTree to `path`.
+
+    The tree is written to a temporary file first and moved into place, so concurrent readers
+    never observe a partially written cache.
+
+    Args:
+        cwe_tree (CweTree): The populated CweTree instance to serialize.
+        path (str): The destination file path.
+    """
+    import tempfile  # Deferred: only needed when (re)writing the cache, and costly to import
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")  # Unique per writer
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(cwe_tree, f, protocol=pickle_protocol)
+        os.chmod(tmp_path, 0o644)  # mkstemp creates owner-only files; the cache is shared package data
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _load_data(cwe_tree: CweTree) -> CweTree:
+    """
+    Loads the CWE tree, preferring the pickled cache in `data/tree.pkl` over parsing the CSV files.
+
+    If the cache is missing, stale, or unreadable, `cwe_tree` is populated from the CSV files and the
+    result is written back to the cache. Failing to write the cache (e.g. a read-only installation)
+    is not an error.
+
+    Args:
+        cwe_tree (CweTree): An instance of CweTree to be populated when the cache cannot be used.
+
+    Returns:
+        CweTree: A fully populated CweTree instance containing all CWE nodes and relationships.
+    """
+    if _cache_is_fresh():
+        try:
+            with open(tree_pkl, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            pass  # Corrupt or incompatible cache; rebuild it from the CSV files
+
+    _build_tree(cwe_tree)
+    try:
+        _dump_tree(cwe_tree, tree_pkl)
+    except Exception:
+        pass  # Cache is an optimization only (read-only install, pickling failure, ...)
+    return cwe_tree
+
+def __getattr__(name: str):
+    """
+    Lazily builds the shared `query` tree on first access (PEP 562).
+
+    Importing the package no longer parses the CSV files; the tree is loaded once, the first time
+    `cwe_tree.query` is requested, and cached as a module global so later lookups bypass this hook.
+
+    Args:
+        name (str): The attribute name being looked up on the module.
+
+    Returns:
+        CweTree: The populated CweTree instance when `name` is "query".
+
+    Raises:
+        AttributeError: If `name` is not a lazily provided attribute.
+    """
+    global query
+    if name == "query":
+        with _query_lock:
+            if "query" not in globals():  # Another thread may have built it while we waited
+                query = _load_data(CweTree())  # Build once and cache as a regular module attribute
+        return query
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Define `__all__` to specify the public API of the module
 __all__ = ["query", "CweTree", "CweNode"]  # Allows users to import `query`, `CweTree`, and `CweNode`
@@ -1,3 +1,55 @@
+import re
+from types import MappingProxyType
+
+# Shape of a well-formed layer string: a flat JSON object of integer levels, e.g. {"CWE-284": 2}
+# Keys may not contain escapes, commas or colons, which keeps `_parse_layer` a simple split
+_LAYER_ENTRY = r'[ \t\n\r]*"[^"\\\x00-\x1f,:]*"[ \t\n\r]*:[ \t\n\r]*-?(?:0|[1-9][0-9]*)[ \t\n\r]*'
+_LAYER_PATTERN = re.compile(rf"\{{(?:{_LAYER_ENTRY}(?:,{_LAYER_ENTRY})*|[ \t\n\r]*)\}}")
+
+# Layer mappings are shared between nodes and must never be mutated in place (copy-on-write)
+_NO_LAYER = {}  # Shared empty layer mapping
+_parsed_layers = {}  # Parsed layer mapping by raw layer string { '{"CWE-284":2}': { "CWE-284": 2 } }
+
+def _parse_layer(raw: str) -> dict:
+    """
+    Parses a layer string already validated against `_LAYER_PATTERN`.
+
+    Specialized for the fixed `{"CWE-284": 2, ...}` shape: split the body on commas, split each
+    entry on its colon, take the key between the quotes and convert the level with `int`.
+
+    Args:
+        raw (str): A validated layer string.
+
+    Returns:
+        dict: The layer mapping (e.g., { "CWE-284": 2 }).
+    """
+    layer = {}
+    body = raw[1:-1]
+    if body.strip():
+        for entry in body.split(","):
+            key, level = entry.split(":")
+            layer[key[key.index('"') + 1:key.rindex('"')]] = int(level)
+    return layer
+
+def _parse_layer_cached(raw: str) -> dict:
+    """
+    Parses a raw layer string, returning the same shared mapping for identical strings.
+
+    Most nodes repeat one of a few dozen layer strings, so sharing the parsed mappings avoids
+    allocating a separate dict per node.
+
+    Args:
+        raw (str): A JSON object string mapping root CWE IDs to levels.
+
+    Returns:
+        dict: The shared (read-only) layer mapping; empty if the string is malformed.
+    """
+    layer = _parsed_layers.get(raw)
+    if layer is None:
+        layer = _parse_layer(raw) if _LAYER_PATTERN.fullmatch(raw) else _NO_LAYER
+        _parsed_layers[raw] = layer
+    return layer
+
 class CweNode:
     """
     Represents a single CWE (Common Weakness Enumeration) node in the CWE hierarchy.
@@ -10,6 +62,8 @@ class CweNode:
     - Parent-child relationships to track CWE dependencies.
     """
 
+    __slots__ = ("_cwe_id", "_name", "_abstract", "_layer", "_layer_raw", "_parents", "_children", "_parent_ids", "_child_ids")
+
     def __init__(self, cwe_id: str, name: str, abstract: str):
         """
         Initializes a CWE node with its unique ID, name, and type.
@@ -22,9 +76,12 @@ class CweNode:
         self._cwe_id = cwe_id  # CWE ID (e.g., "CWE-732")
         self._name = name  # CWE Name (e.g., "Incorrect Permission Assignment for Critical Resource")
         self._abstract = abstract  # CWE Type (e.g., "Class", "Base", "Variant")
-        self._layer = {}  # Dictionary to store layer levels in different trees { "CWE-284": 2 }
-        self._parents = set()  # Set of parent nodes (other CWEs this node is derived from)
-        self._children = set()  # Set of child nodes (other CWEs that depend on this node)
+        self._layer = _NO_LAYER  # Shared, copy-on-write mapping of layer levels in different trees { "CWE-284": 2 }
+        self._layer_raw = None  # Unparsed JSON layer string, merged into `_layer` on first access
+        self._parents = set()  # Set of parent CweNode instances (other CWEs this node is derived from)
+        self._children = set()  # Set of child CweNode instances (other CWEs that depend on this node)
+        self._parent_ids = None  # Cached frozenset of parent CWE IDs, reset when a parent is added
+        self._child_ids = None  # Cached frozenset of child CWE IDs, reset when a child is added
 
     @property
     def cwe_id(self) -> str:
@@ -42,34 +99,76 @@ class CweNode:
         return self._abstract
 
     @property
-    def layer(self) -> dict:
+    def layer(self) -> MappingProxyType:
         """
-        Returns a copy of the layer mapping.
+        Returns a read-only view of the layer mapping.
 
         The layer mapping stores the depth level of this node in different root CWE trees.
         Example:
             { "CWE-284": 2 } means this node is at level 2 in the CWE-284 hierarchy.
         """
-        return self._layer.copy()  # Return a copy to prevent modification
+        return MappingProxyType(self._load_layer())  # Read-only view, no copy
 
     @property
-    def parents(self) -> set:
+    def parents(self) -> frozenset:
         """
-        Returns a copy of the set of parent CWE nodes.
+        Returns the immutable set of parent CWE IDs.
 
         Parents are CWEs from which this node is derived.
+        The set is built once and the same object is returned on every later access.
         """
-        return self._parents.copy()  # Return a copy to prevent modification
+        if self._parent_ids is None:
+            self._parent_ids = frozenset([parent._cwe_id for parent in self._parents])
+        return self._parent_ids
 
     @property
-    def children(self) -> set:
+    def children(self) -> frozenset:
         """
-        Returns a copy of the set of child CWE nodes.
+        Returns the immutable set of child CWE IDs.
 
         Children are CWEs that depend on this node.
+        The set is built once and the same object is returned on every later access.
+        """
+        if self._child_ids is None:
+            self._child_ids = frozenset([child._cwe_id for child in self._children])
+        return self._child_ids
+
+    @property
+    def parent_nodes(self) -> set:
+        """
+        Returns a copy of the set of parent CweNode instances.
+
+        Useful for traversals, which can follow node references without looking IDs up in the tree.
+        """
+        return self._parents.copy()  # Return a copy to prevent modification
+
+    @property
+    def child_nodes(self) -> set:
+        """
+        Returns a copy of the set of child CweNode instances.
+
+        Useful for traversals, which can follow node references without looking IDs up in the tree.
         """
         return self._children.copy()  # Return a copy to prevent modification
 
+    def iter_parents(self):
+        """
+        Iterates over the parent CweNode instances without copying the underlying set.
+
+        Returns:
+            Iterator[CweNode]: An iterator over this node's parents.
+        """
+        return iter(self._parents)
+
+    def iter_children(self):
+        """
+        Iterates over the child CweNode instances without copying the underlying set.
+
+        Returns:
+            Iterator[CweNode]: An iterator over this node's children.
+        """
+        return iter(self._children)
+
     def _add_layer(self, root_id: str, level: int):
         """
         Adds or updates the layer mapping for this node.
@@ -78,25 +177,59 @@ class CweNode:
             root_id (str): The root CWE ID representing the tree.
             level (int): The depth level of this node in the specified CWE tree.
         """
-        self._layer[root_id] = level
+        self._layer = {**self._load_layer(), root_id: level}  # Copy, the current mapping may be shared
 
-    def _add_parent(self, parent_id: str):
+    def _add_layer_raw(self, layer: str):
         """
-        Adds a parent CWE ID to this node.
+        Stores a raw JSON layer string to be parsed the first time the layer mapping is needed.
 
         Args:
-            parent_id (str): The CWE ID of the parent node.
+            layer (str): A JSON object string mapping root CWE IDs to levels (e.g., '{"CWE-284": 2}').
+        """
+        self._load_layer()  # Apply any pending string first so later updates still win
+        self._layer_raw = layer
+
+    def _load_layer(self) -> dict:
+        """
+        Parses the pending raw layer string, if any, into the layer mapping.
+
+        Strings that are not a flat JSON object of integer levels are ignored.
+
+        Returns:
+            dict: The internal layer mapping, possibly shared with other nodes; do not mutate it.
         """
-        self._parents.add(parent_id)
+        raw = self._layer_raw
+        if raw is None:
+            return self._layer
+        layer = self._layer
+        parsed = _parse_layer_cached(raw)
+        if parsed:
+            layer = {**layer, **parsed} if layer else parsed
+        # Publish the mapping before clearing the raw string, so concurrent readers never see neither;
+        # a reader that races in here merges the same string again, which is idempotent
+        self._layer = layer
+        self._layer_raw = None
+        return layer
 
-    def _add_child(self, child_id: str):
+    def _add_parent(self, parent: "CweNode"):
         """
-        Adds a child CWE ID to this node.
+        Adds a parent CWE node to this node.
 
         Args:
-            child_id (str): The CWE ID of the child node.
+            parent (CweNode): The parent node.
         """
-        self._children.add(child_id)
+        self._parents.add(parent)
+        self._parent_ids = None  # Cached ID set is stale
+
+    def _add_child(self, child: "CweNode"):
+        """
+        Adds a child CWE node to this node.
+
+        Args:
+            child (CweNode): The child node.
+        """
+        self._children.add(child)
+        self._child_ids = None  # Cached ID set is stale
 
     def get_metadata(self) -> dict:
         """
@@ -110,7 +243,27 @@ class CweNode:
             "id": self.cwe_id,
             "name": self.name,
             "abstract": self.abstract,
-            "layer": self.layer,  # Layer mapping in different root trees
+            "layer": dict(self._load_layer()),  # Layer mapping in different root trees (plain dict for serialization)
             "parents": list(self.parents),  # Convert set to list for serialization
             "children": list(self.children),  # Convert set to list for serialization
         }
+
+    def get_metadata_view(self) -> dict:
+        """
+        Returns the same fields as `get_metadata()` without copying the relationships.
+
+        Intended for bulk export of the whole tree. Parents and children are the cached frozensets of
+        IDs. The layer mapping is still copied, since the internal one is shared with other nodes.
+        Serialize with `json.dumps(view, default=list)` to turn the frozensets into lists.
+
+        Returns:
+            dict: A dictionary containing CWE node information.
+        """
+        return {
+            "id": self._cwe_id,
+            "name": self._name,
+            "abstract": self._abstract,
+            "layer": dict(self._load_layer()),  # Copy; the internal mapping may be shared between nodes
+            "parents": self.parents,  # Cached frozenset
+            "children": self.children,  # Cached frozenset
+        }
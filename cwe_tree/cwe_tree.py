@@ -1,6 +1,32 @@
-import json
+import sys
+from types import MappingProxyType
 from .cwe_node import CweNode
 
+_EMPTY_LAYER = MappingProxyType({})  # Read-only layer mapping returned for unknown CWE IDs
+
+def _reachable(adjacency: list, start: int) -> list:
+    """
+    Collects every node index reachable from `start` along `adjacency`, excluding `start` itself.
+
+    Args:
+        adjacency (list): Tuples of neighbour indices by node index (e.g., `CweTree._child_idx`).
+        start (int): The index to start the walk from.
+
+    Returns:
+        list: The reachable node indices, in no particular order.
+    """
+    visited = bytearray(len(adjacency))  # One flag per node instead of a set of hashed objects
+    visited[start] = 1
+    stack = [start]
+    found = []
+    while stack:
+        for j in adjacency[stack.pop()]:
+            if not visited[j]:
+                visited[j] = 1
+                found.append(j)
+                stack.append(j)
+    return found
+
 class CweTree:
     """
     Represents a CWE Tree, which contains CWE nodes and their relationships.
@@ -14,6 +40,14 @@ class CweTree:
     def __init__(self):
         """ Initializes an empty CWE Tree. """
         self._nodes = {}  # Dictionary to store CWE nodes { "CWE-732": CweNode, ... }
+        self._nodes_by_numeric = {}  # Same nodes keyed by the bare number { "732": CweNode, ... }
+        self._roots = None  # Cached list of parentless nodes, computed by `get_roots()`
+
+        # Dense integer index over the nodes, built by `_finalize()` and reset by any mutation
+        self._idx_to_id = None  # List of CWE IDs by index [ "CWE-732", ... ]
+        self._id_to_idx = None  # Dictionary from CWE ID to index { "CWE-732": 0, ... }
+        self._parent_idx = None  # List of parent index tuples by node index [ (12,), ... ]
+        self._child_idx = None  # List of child index tuples by node index [ (1, 5, 9), ... ]
 
     def _normalize_cwe(self, cwe_id: str) -> str:
         """
@@ -21,14 +55,15 @@ class CweTree:
 
         If the CWE ID does not start with "CWE-", it adds the prefix.
         This allows users to query using either "732" or "CWE-732".
+        The result is interned so every node key and relationship shares one string object per ID.
 
         Args:
             cwe_id (str): The CWE ID to normalize.
 
         Returns:
-            str: Normalized CWE ID (e.g., "CWE-732").
+            str: Normalized, interned CWE ID (e.g., "CWE-732").
         """
-        return f"CWE-{cwe_id}" if not cwe_id.startswith("CWE-") else cwe_id
+        return sys.intern(cwe_id if cwe_id[:4] == "CWE-" else f"CWE-{cwe_id}")
 
     def _add_node(self, cwe_id: str, name: str, abstract: str, layer: str):
         """
@@ -43,17 +78,21 @@ class CweTree:
         cwe_id = self._normalize_cwe(cwe_id)
 
         # Create node if it doesn't already exist
-        if cwe_id not in self._nodes:
-            self._nodes[cwe_id] = CweNode(cwe_id, name, abstract)
-
-        # Parse and store layer data (JSON format)
-        try:
-            layer_data = json.loads(layer) if isinstance(layer, str) else layer
-            if isinstance(layer_data, dict):
-                for root, level in layer_data.items():
-                    self._nodes[cwe_id]._add_layer(root, level)
-        except json.JSONDecodeError:
-            pass  # Ignore invalid layer data
+        node = self._nodes.get(cwe_id)
+        if node is None:
+            node = self._nodes[cwe_id] = CweNode(cwe_id, name, abstract)
+            self._nodes_by_numeric[sys.intern(cwe_id[4:])] = node  # Allows "732" lookups without normalizing
+            self._child_idx = None  # Index is stale
+            self._roots = None  # New node is a root until it gets a parent
+
+        # Store layer data; JSON strings are parsed lazily on first access to the layer
+        if not layer:
+            return  # No layer data for this row
+        if isinstance(layer, str):
+            node._add_layer_raw(sys.intern(layer))  # Layer strings repeat heavily across nodes
+        elif isinstance(layer, dict):
+            for root, level in layer.items():
+                node._add_layer(root, level)
 
     def _add_edge(self, parent_id: str, child_id: str):
         """
@@ -67,8 +106,43 @@ class CweTree:
 
         # Ensure both nodes exist before creating a relationship
         if parent_id in self._nodes and child_id in self._nodes:
-            self._nodes[parent_id]._add_child(child_id)
-            self._nodes[child_id]._add_parent(parent_id)
+            self._add_edge_unchecked(parent_id, child_id)
+
+    def _add_edge_unchecked(self, parent_id: str, child_id: str):
+        """
+        Establishes a parent-child relationship between two existing CWE nodes.
+
+        Used by the data loader: the IDs must already be normalized and both nodes must exist,
+        which the build-time data validation guarantees for the packaged CSV files.
+
+        Args:
+            parent_id (str): The normalized CWE ID of the parent node.
+            child_id (str): The normalized CWE ID of the child node.
+
+        Raises:
+            KeyError: If either node does not exist.
+        """
+        parent, child = self._nodes[parent_id], self._nodes[child_id]
+        parent._add_child(child)
+        child._add_parent(parent)
+        self._child_idx = None  # Index is stale
+        self._roots = None  # Child may have stopped being a root
+
+    def _finalize(self):
+        """
+        Builds the dense integer index over the loaded nodes.
+
+        Every node gets a position in `_idx_to_id`, and its parents and children are stored as tuples
+        of positions, so whole-graph walks can iterate flat integer tuples and mark visited nodes in
+        a bytearray instead of hashing node objects. Call again after mutating the tree.
+        """
+        idx_to_id = list(self._nodes)
+        id_to_idx = {cwe_id: i for i, cwe_id in enumerate(idx_to_id)}
+        nodes = self._nodes.values()
+        # Build each tuple from a list so it is allocated once at its final size
+        self._parent_idx = [tuple([id_to_idx[parent._cwe_id] for parent in node._parents]) for node in nodes]
+        self._idx_to_id, self._id_to_idx = idx_to_id, id_to_idx
+        self._child_idx = [tuple([id_to_idx[child._cwe_id] for child in node._children]) for node in nodes]
 
     def get_node(self, cwe_id: str) -> CweNode:
         """
@@ -80,10 +154,10 @@ class CweTree:
         Returns:
             CweNode: The requested CWE node, or None if it does not exist.
         """
-        cwe_id = self._normalize_cwe(cwe_id)
-        return self._nodes.get(cwe_id)
+        # Accepts "CWE-732" or "732" with plain dict lookups, without building a normalized string
+        return self._nodes.get(cwe_id) or self._nodes_by_numeric.get(cwe_id)
 
-    def get_parents(self, cwe_id: str) -> set:
+    def get_parents(self, cwe_id: str) -> frozenset:
         """
         Retrieves the parents of a given CWE node.
 
@@ -91,12 +165,12 @@ class CweTree:
             cwe_id (str): The CWE ID whose parents should be retrieved.
 
         Returns:
-            set: A set of parent CWE IDs.
+            frozenset: An immutable set of parent CWE IDs.
         """
         node = self.get_node(cwe_id)
-        return node.parents if node else set()
+        return node.parents if node else frozenset()  # Cached on the node, no copy
 
-    def get_children(self, cwe_id: str) -> set:
+    def get_children(self, cwe_id: str) -> frozenset:
         """
         Retrieves the children of a given CWE node.
 
@@ -104,12 +178,12 @@ class CweTree:
             cwe_id (str): The CWE ID whose children should be retrieved.
 
         Returns:
-            set: A set of child CWE IDs.
+            frozenset: An immutable set of child CWE IDs.
         """
         node = self.get_node(cwe_id)
-        return node.children if node else set()
+        return node.children if node else frozenset()  # Cached on the node, no copy
 
-    def get_layer(self, cwe_id: str) -> dict:
+    def get_layer(self, cwe_id: str) -> MappingProxyType:
         """
         Retrieves the layer information for a given CWE node.
 
@@ -117,10 +191,54 @@ class CweTree:
             cwe_id (str): The CWE ID whose layer should be retrieved.
 
         Returns:
-            dict: A dictionary representing the layer mapping (e.g., { "CWE-284": 2 }).
+            MappingProxyType: A read-only mapping of the layer levels (e.g., { "CWE-284": 2 }).
+        """
+        node = self.get_node(cwe_id)
+        return node.layer if node else _EMPTY_LAYER
+
+    def get_ancestors(self, cwe_id: str) -> frozenset:
+        """
+        Retrieves all transitive parents of a given CWE node.
+
+        Args:
+            cwe_id (str): The CWE ID whose ancestors should be retrieved.
+
+        Returns:
+            frozenset: An immutable set of ancestor CWE IDs.
+        """
+        return self._walk(cwe_id, parents=True)
+
+    def get_descendants(self, cwe_id: str) -> frozenset:
+        """
+        Retrieves all transitive children of a given CWE node.
+
+        Args:
+            cwe_id (str): The CWE ID whose descendants should be retrieved.
+
+        Returns:
+            frozenset: An immutable set of descendant CWE IDs.
+        """
+        return self._walk(cwe_id, parents=False)
+
+    def _walk(self, cwe_id: str, parents: bool) -> frozenset:
+        """
+        Walks the integer index from a CWE node, building the index first if it is missing or stale.
+
+        Args:
+            cwe_id (str): The CWE ID to start from.
+            parents (bool): Follow parent links if True, child links otherwise.
+
+        Returns:
+            frozenset: An immutable set of reachable CWE IDs, empty if the node does not exist.
         """
         node = self.get_node(cwe_id)
-        return node.layer if node else {}
+        if node is None:
+            return frozenset()
+        if self._child_idx is None:
+            self._finalize()
+        adjacency = self._parent_idx if parents else self._child_idx
+        idx_to_id = self._idx_to_id
+        return frozenset(idx_to_id[j] for j in _reachable(adjacency, self._id_to_idx[node.cwe_id]))
 
     def get_metadata(self, cwe_id: str) -> dict:
         """
@@ -144,4 +262,6 @@ class CweTree:
         Returns:
             list: A list of CweNode instances that have no parents.
         """
-        return [node for node in self._nodes.values() if not node.parents]
+        if self._roots is None:
+            self._roots = [node for node in self._nodes.values() if not node._parents]  # Raw set, no copy
+        return list(self._roots)  # Return a copy so callers cannot alter the cache
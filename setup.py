@@ -1,4 +1,82 @@
+import csv, json, os, sys
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
+
+here = os.path.dirname(os.path.abspath(__file__))  # 项目根目录
+
+
+def use_source_package():
+    """
+    Makes the in-tree `cwe_tree` package importable by the build helpers below.
+    """
+    if here not in sys.path:
+        sys.path.insert(0, here)
+
+
+def validate_data():
+    """
+    Checks the packaged CSV data so the runtime loader can assume well-formed rows.
+
+    Every node needs a unique `CWE-` prefixed ID, every non-empty layer must be a flat JSON
+    object of integer levels that `_parse_layer` reads exactly like `json.loads`, and every
+    relationship must connect two existing nodes.
+
+    Raises:
+        SystemExit: If any row is malformed, listing every problem found.
+    """
+    use_source_package()
+    from cwe_tree import CweTree, nodes_csv, rels_csv, _build_tree, _read_csv
+    from cwe_tree.cwe_node import _LAYER_PATTERN, _parse_layer
+
+    errors = []
+    seen = set()
+    try:
+        # Read through the loader's own `_read_csv`, so anything accepted here also loads at runtime
+        nodes = _read_csv(nodes_csv, "id", "name", "abstract", "layer")  # Same columns as `_build_tree`
+        for row, (cwe_id, _, _, layer) in enumerate(nodes, start=1):
+            if not cwe_id.startswith("CWE-") or cwe_id in seen:
+                errors.append(f"nodes.csv row {row}: invalid or duplicate id {cwe_id!r}")
+            seen.add(cwe_id)
+            if layer and not (_LAYER_PATTERN.fullmatch(layer) and _parse_layer(layer) == json.loads(layer)):
+                errors.append(f"nodes.csv row {row}: malformed layer {layer!r}")
+        for row, ends in enumerate(_read_csv(rels_csv, "source", "target"), start=1):
+            for end, cwe_id in zip(("source", "target"), ends):
+                if cwe_id not in seen:
+                    errors.append(f"rels.csv row {row}: unknown {end} {cwe_id!r}")
+        if not errors:
+            _build_tree(CweTree())  # Finally run the real loader end to end
+    except (KeyError, IndexError, csv.Error) as e:
+        errors.append(f"unreadable CSV data: {e!r}")
+    if errors:
+        raise SystemExit("Invalid CWE data:\n" + "\n".join(errors))
+
+
+def prebuild_tree(target_dir: str):
+    """
+    Builds the CWE tree from the CSV files and pickles it into the build output.
+
+    Installed packages then load the tree with a single `pickle.load` instead of parsing
+    `nodes.csv` and `rels.csv` on first use.
+
+    Args:
+        target_dir (str): The `cwe_tree` package directory inside the build output.
+    """
+    use_source_package()
+    from cwe_tree import CweTree, _build_tree, _dump_tree
+
+    _dump_tree(_build_tree(CweTree()), os.path.join(target_dir, "data", "tree.pkl"))
+
+
+class BuildPyWithData(build_py):
+    """ `build_py` that validates the CWE data and ships a prebuilt tree with it. """
+
+    def run(self):
+        validate_data()
+        super().run()
+        # Editable installs copy nothing into `build_lib`; they fall back to the runtime cache instead
+        if not self.dry_run and not getattr(self, "editable_mode", False):
+            prebuild_tree(os.path.join(self.build_lib, "cwe_tree"))  # After copying, so the pickle is newest
+
 
 setup(
     name="cwe_tree",  # 你的包名
@@ -10,9 +88,10 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/YichaoXu/cwe-tree",  # GitHub 项目地址
     packages=find_packages(),
-    package_data={"cwe_tree": ["data/*.csv"]},
+    package_data={"cwe_tree": ["data/*.csv"]},  # tree.pkl is generated into the build by build_py
     include_package_data=True,  # 包含 `data/` 目录下的 CSV 文件
     install_requires=[],  # 你的包的依赖项（如果有）
+    cmdclass={"build_py": BuildPyWithData},  # 构建时校验 CSV 数据并预生成 tree.pkl
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
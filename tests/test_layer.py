@@ -0,0 +1,55 @@
+import json
+import unittest
+
+from cwe_tree import CweNode
+from cwe_tree.cwe_node import _parse_layer_cached
+
+
+class LayerParserTest(unittest.TestCase):
+    """ Tests for the specialized layer parser that replaces `json.loads`. """
+
+    def test_matches_json_on_valid_input(self):
+        for raw in (
+            '{"CWE-284":2}',
+            '{"CWE-284": 2, "CWE-664": 3}',
+            '{ \t\n"CWE-284" \r: \n2\t, "CWE-664":3 }',
+            "{}",
+            "{ \n }",
+            '{"CWE-284":-1}',
+            '{"CWE-284":0}',
+            '{"CWE-284":1,"CWE-284":4}',  # Duplicate keys: last one wins, like json
+            '{"":7}',
+        ):
+            self.assertEqual(_parse_layer_cached(raw), json.loads(raw), raw)
+
+    def test_malformed_input_is_empty(self):
+        for raw in (
+            "",
+            "null",
+            "[]",
+            '{"CWE-284":1.5}',  # Non-integer level
+            '{"CWE-284":"2"}',
+            '{"CWE-284":02}',
+            '{"CWE-284":2,}',
+            '{"CWE-284":2',
+            '{"CWE,284":2}',  # Commas and colons are not allowed in keys
+            '{"CWE:284":2}',
+            '{"CWE-\\u0032":2}',  # No escapes
+            '{"a":{"b":1}}',
+        ):
+            self.assertEqual(_parse_layer_cached(raw), {}, raw)
+
+    def test_node_layer(self):
+        node = CweNode("CWE-1", "name", "Class")
+        node._add_layer_raw('{"CWE-284": 2}')
+        node._add_layer_raw('{"CWE-664": 3}')
+        node._add_layer("CWE-284", 5)
+        self.assertEqual(dict(node.layer), {"CWE-284": 5, "CWE-664": 3})
+
+        malformed = CweNode("CWE-2", "name", "Class")
+        malformed._add_layer_raw('{"CWE-284": x}')
+        self.assertEqual(dict(malformed.layer), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+from cwe_tree import CweTree, query
+
+
+def _closure(step, cwe_id: str) -> set:
+    """ Transitive closure of `step` (get_parents/get_children) from `cwe_id`, excluding it. """
+    found, stack = set(), [cwe_id]
+    while stack:
+        for next_id in step(stack.pop()):
+            if next_id not in found:
+                found.add(next_id)
+                stack.append(next_id)
+    found.discard(cwe_id)
+    return found
+
+
+class TraversalTest(unittest.TestCase):
+    """ Tests for `CweTree.get_ancestors` and `CweTree.get_descendants`. """
+
+    def test_matches_closure_on_packaged_data(self):
+        for cwe_id in query._nodes:
+            self.assertEqual(query.get_ancestors(cwe_id), _closure(query.get_parents, cwe_id), cwe_id)
+            self.assertEqual(query.get_descendants(cwe_id), _closure(query.get_children, cwe_id), cwe_id)
+
+    def test_unknown_id_returns_empty_frozenset(self):
+        self.assertEqual(query.get_ancestors("CWE-999999"), frozenset())
+        self.assertEqual(query.get_descendants("not-a-cwe"), frozenset())
+        self.assertIsInstance(query.get_descendants("CWE-999999"), frozenset)
+
+    def test_start_node_is_excluded(self):
+        tree = CweTree()
+        for cwe_id in ("1", "2"):
+            tree._add_node(cwe_id, "name", "Class", "")
+        tree._add_edge("1", "2")
+        tree._add_edge("2", "1")  # Cycle back to the start node
+        self.assertEqual(tree.get_descendants("1"), {"CWE-2"})
+        self.assertEqual(tree.get_ancestors("CWE-1"), {"CWE-2"})
+
+    def test_index_rebuilt_after_mutation(self):
+        tree = CweTree()
+        for cwe_id in ("1", "2"):
+            tree._add_node(cwe_id, "name", "Class", "")
+        tree._add_edge("1", "2")
+        self.assertEqual(tree.get_descendants("1"), {"CWE-2"})
+
+        tree._add_node("3", "name", "Variant", "")
+        self.assertEqual(tree.get_descendants("3"), frozenset())
+        tree._add_edge("2", "3")
+        self.assertEqual(tree.get_descendants("1"), {"CWE-2", "CWE-3"})
+        self.assertEqual(tree.get_ancestors("3"), {"CWE-1", "CWE-2"})
+
+
+if __name__ == "__main__":
+    unittest.main()